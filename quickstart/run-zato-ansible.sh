@@ -109,13 +109,13 @@ cli_params.append('/opt/zato/env/qs-1/server1/logs/server.log')
 # Build a full command
 command = ' '.join(cli_params)
 
-# And write it to a file that will be invoked
-f = open('/zato-ansible/run-zato-ansible-impl.sh', 'w')
-f.write('#!/bin/bash')
-f.write('\n')
-f.write(command)
-f.write('\n')
-f.close()
+# Assemble the script to be invoked
+script = ['#!/bin/bash\n', command, '\n']
+
+# And write it to a file that will be invoked - the file is closed
+# before the shell below runs it.
+with open('/zato-ansible/run-zato-ansible-impl.sh', 'w') as f:
+    f.writelines(script)
 
 IN_PYTHON
 